@@ -2,6 +2,7 @@ import os
 
 from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, make_response
 from functools import wraps
+import click
 import pymongo
 import os
 
@@ -19,6 +20,8 @@ from pdf2image import convert_from_path
 
 import csv
 
+from validation import STUDENT_FIELDS, STUDENT_SCHEMA, coerce_number, validate_student, migrate_student_types
+
 load_dotenv()
 
 app = Flask(__name__)
@@ -71,11 +74,14 @@ def login_required(f):
         return redirect(url_for('login'))
     return decorated_function
 
-STUDENT_FIELDS = [
-    'name', 'weekend_exam', 'mid_marks', 'crt_score', 'attendance_percent', 'gd_attendance',
-    'previous_sem_percent', 'extra_activities_score', 'project_count',
-    'backlogs'
-]
+@app.cli.command('migrate-student-types')
+def migrate_student_types_command():
+    """Store numeric student fields as numbers in every group."""
+    for name in mongo.db.list_collection_names():
+        if name == 'users' or name.startswith('system.'):
+            continue
+        updated, unconvertible = migrate_student_types(mongo.db[name])
+        click.echo(f"{name}: {updated} updated, {unconvertible} with non-numeric values that could not be converted")
 
 def get_collection(group_name=None):
     if group_name:
@@ -83,82 +89,63 @@ def get_collection(group_name=None):
     return mongo.db.students
 
 # --- Categorization Logic ---
+def _student_number(student, field):
+    # Stored values are already numbers; legacy string values are coerced here
+    value = student.get(field, 0)
+    try:
+        return coerce_number(value, STUDENT_SCHEMA[field]['type'])
+    except (TypeError, ValueError, OverflowError):
+        return 0
+
 def categorize_student(student):
     red_zone_fields = []
     average_fields = []
     # Weekend Exam (avg)
-    try:
-        weekend_avg = float(student.get('weekend_exam', 0))
-    except:
-        weekend_avg = 0
+    weekend_avg = _student_number(student, 'weekend_exam')
     if weekend_avg < 50:
         red_zone_fields.append('weekend_exam')
     elif weekend_avg < 75:
         average_fields.append('weekend_exam')
     # Mid Marks (avg)
-    try:
-        mid_avg = float(student.get('mid_marks', 0))
-    except:
-        mid_avg = 0
+    mid_avg = _student_number(student, 'mid_marks')
     if mid_avg < 50:
         red_zone_fields.append('mid_marks')
     elif mid_avg < 75:
         average_fields.append('mid_marks')
     # CRT Score (%)
-    try:
-        crt = float(student.get('crt_score', 0))
-    except:
-        crt = 0
+    crt = _student_number(student, 'crt_score')
     if crt < 50:
         red_zone_fields.append('crt_score')
     elif crt < 70:
         average_fields.append('crt_score')
     # Attendance (%)
-    try:
-        att = float(student.get('attendance_percent', 0))
-    except:
-        att = 0
+    att = _student_number(student, 'attendance_percent')
     if att < 70:
         red_zone_fields.append('attendance_percent')
     elif att < 80:
         average_fields.append('attendance_percent')
     # GD Attendance (%)
-    try:
-        gd = float(student.get('gd_attendance', 0))
-    except:
-        gd = 0
+    gd = _student_number(student, 'gd_attendance')
     if gd < 40:
         red_zone_fields.append('gd_attendance')
     elif gd < 70:
         average_fields.append('gd_attendance')
     # Previous Sem GPA
-    try:
-        prev_gpa = float(student.get('previous_sem_percent', 0))
-    except:
-        prev_gpa = 0
+    prev_gpa = _student_number(student, 'previous_sem_percent')
     if prev_gpa < 7.0:
         red_zone_fields.append('previous_sem_percent')
     elif prev_gpa < 8.0:
         average_fields.append('previous_sem_percent')
     # Backlogs
-    try:
-        backlogs = int(student.get('backlogs', 0))
-    except:
-        backlogs = 0
+    backlogs = _student_number(student, 'backlogs')
     if backlogs > 0:
         red_zone_fields.append('backlogs')
     # Extra Activities
-    try:
-        extra = int(student.get('extra_activities_score', 0))
-    except:
-        extra = 0
+    extra = _student_number(student, 'extra_activities_score')
     if extra == 0:
         red_zone_fields.append('extra_activities_score')
     # Projects Completed
-    try:
-        projects = int(student.get('project_count', 0))
-    except:
-        projects = 0
+    projects = _student_number(student, 'project_count')
     if projects == 0:
         red_zone_fields.append('project_count')
     # Final Zone
@@ -180,40 +167,7 @@ def add_student():
         session['group'] = group
     collection = get_collection(group)
     if request.method == 'POST':
-        # Add validation for specific fields
-        errors = {}
-        
-        # Validate previous_sem_percent (GPA) - should be <= 10
-        try:
-            prev_sem_gpa = float(request.form.get('previous_sem_percent', 0))
-            if prev_sem_gpa > 10:
-                errors['previous_sem_percent'] = "Previous Sem GPA value must be less than or equal to 10"
-        except ValueError:
-            pass  # Will be handled by existing validation
-        
-        # Validate extra_activities_score - should be <= 10
-        try:
-            extra_activities = float(request.form.get('extra_activities_score', 0))
-            if extra_activities > 10:
-                errors['extra_activities_score'] = "Extra Activities value must be less than or equal to 10"
-        except ValueError:
-            pass  # Will be handled by existing validation
-            
-        # Validate project_count - should be <= 10
-        try:
-            projects = float(request.form.get('project_count', 0))
-            if projects > 10:
-                errors['project_count'] = "Projects value must be less than or equal to 10"
-        except ValueError:
-            pass  # Will be handled by existing validation
-            
-        # Validate backlogs - should be <= 15
-        try:
-            backlogs = float(request.form.get('backlogs', 0))
-            if backlogs > 15:
-                errors['backlogs'] = "Backlogs value must be less than or equal to 15"
-        except ValueError:
-            pass  # Will be handled by existing validation
+        data, errors = validate_student(request.form)
             
         # If there are validation errors, display them
         if errors:
@@ -221,7 +175,6 @@ def add_student():
             form_data = {field: request.form.get(field, '') for field in STUDENT_FIELDS}
             return render_template('add_student.html', fields=STUDENT_FIELDS, group=group, errors=errors, form_data=form_data)
             
-        data = {field: request.form.get(field) for field in STUDENT_FIELDS}
         zone, red, avg = categorize_student(data)
         data['zone'] = zone
         data['red_zone_fields'] = red
@@ -289,46 +242,12 @@ def api_add_student():
     group = request.args.get('group')
     collection = get_collection(group)
     
-    # Add validation for specific fields
-    errors = []
-    
-    # Validate previous_sem_percent (GPA) - should be <= 10
-    try:
-        prev_sem_gpa = float(request.form.get('previous_sem_percent', 0))
-        if prev_sem_gpa > 10:
-            errors.append("Previous Sem GPA value must be less than or equal to 10")
-    except ValueError:
-        pass  # Will be handled by existing validation
-    
-    # Validate extra_activities_score - should be <= 10
-    try:
-        extra_activities = float(request.form.get('extra_activities_score', 0))
-        if extra_activities > 10:
-            errors.append("Extra Activities value must be less than or equal to 10")
-    except ValueError:
-        pass  # Will be handled by existing validation
-        
-    # Validate project_count - should be <= 10
-    try:
-        projects = float(request.form.get('project_count', 0))
-        if projects > 10:
-            errors.append("Projects value must be less than or equal to 10")
-    except ValueError:
-        pass  # Will be handled by existing validation
-        
-    # Validate backlogs - should be <= 15
-    try:
-        backlogs = float(request.form.get('backlogs', 0))
-        if backlogs > 15:
-            errors.append("Backlogs value must be less than or equal to 15")
-    except ValueError:
-        pass  # Will be handled by existing validation
+    data, errors = validate_student(request.form)
         
     # If there are validation errors, return them
     if errors:
         return jsonify({'success': False, 'errors': errors}), 400
     
-    data = {field: request.form.get(field) for field in STUDENT_FIELDS}
     zone, red, avg = categorize_student(data)
     data['zone'] = zone
     collection.insert_one(data)
@@ -346,48 +265,12 @@ def api_update_student(id):
     group = request.args.get('group')
     collection = get_collection(group)
     
-    # Add validation for specific fields
-    errors = []
-    
-    # Validate previous_sem_percent (GPA) - should be <= 10
-    try:
-        prev_sem_gpa = float(request.form.get('previous_sem_percent', 0))
-        if prev_sem_gpa > 10:
-            errors.append("Previous Sem GPA value must be less than or equal to 10")
-    except ValueError:
-        pass  # Will be handled by existing validation
-    
-    # Validate extra_activities_score - should be <= 10
-    try:
-        extra_activities = float(request.form.get('extra_activities_score', 0))
-        if extra_activities > 10:
-            errors.append("Extra Activities value must be less than or equal to 10")
-    except ValueError:
-        pass  # Will be handled by existing validation
-        
-    # Validate project_count - should be <= 10
-    try:
-        projects = float(request.form.get('project_count', 0))
-        if projects > 10:
-            errors.append("Projects value must be less than or equal to 10")
-    except ValueError:
-        pass  # Will be handled by existing validation
-        
-    # Validate backlogs - should be <= 15
-    try:
-        backlogs = float(request.form.get('backlogs', 0))
-        if backlogs > 15:
-            errors.append("Backlogs value must be less than or equal to 15")
-    except ValueError:
-        pass  # Will be handled by existing validation
+    data, errors = validate_student(request.form)
         
     # If there are validation errors, return them
     if errors:
         return jsonify({'success': False, 'errors': errors}), 400
     
-    # Get the updated data from the request
-    data = {field: request.form.get(field) for field in STUDENT_FIELDS}
-    
     # Recalculate zone based on updated data
     zone, red, avg = categorize_student(data)
     data['zone'] = zone
@@ -2,23 +2,37 @@
 function showInlineError(fieldName, message) {
     // Create error element if it doesn't exist
     let errorElement = document.getElementById(fieldName + '_error');
+    const inputField = document.getElementById(fieldName);
     if (!errorElement) {
         errorElement = document.createElement('div');
         errorElement.id = fieldName + '_error';
         errorElement.className = 'text-danger mt-1';
         // Find the input field and insert the error after it
-        const inputField = document.getElementById(fieldName);
         if (inputField) {
             inputField.parentNode.insertBefore(errorElement, inputField.nextSibling);
-            // Add Bootstrap's is-invalid class to the input field
-            inputField.classList.add('is-invalid');
         }
     }
+    // Add Bootstrap's is-invalid class to the input field
+    if (inputField) {
+        inputField.classList.add('is-invalid');
+    }
     // Set the error message
     errorElement.textContent = message;
     errorElement.style.display = 'block';
 }
 
+function showFormErrors(form, errors) {
+    // Errors are keyed by field name; show each under the matching input
+    Object.entries(errors).forEach(([field, message]) => {
+        const inputField = form.elements[field];
+        if (!inputField) return;
+        if (!inputField.id) {
+            inputField.id = `${form.id}_${field}`;
+        }
+        showInlineError(inputField.id, message);
+    });
+}
+
 function clearInlineErrors() {
     // Clear all inline error messages
     const errorElements = document.querySelectorAll('[id$="_error"]');
@@ -182,7 +196,9 @@ document.addEventListener('DOMContentLoaded', function() {
         .then(res => {
             if (!res.ok) {
                 return res.json().then(errData => {
-                    throw new Error(errData.errors ? errData.errors.join(', ') : 'Unknown error');
+                    const error = new Error(errData.errors ? Object.values(errData.errors).join(', ') : 'Unknown error');
+                    error.fieldErrors = errData.errors;
+                    throw error;
                 });
             }
             return res.json();
@@ -199,20 +215,9 @@ document.addEventListener('DOMContentLoaded', function() {
         })
         .catch(err => {
             // Handle validation errors
-            if (err.message.includes('value must be less than or equal to')) {
-                // Parse the error message to extract field names and error messages
-                const errorMessages = err.message.split(', ');
-                errorMessages.forEach(errorMessage => {
-                    if (errorMessage.includes('Previous Sem GPA')) {
-                        showInlineError('previous_sem_percent', errorMessage);
-                    } else if (errorMessage.includes('Extra Activities')) {
-                        showInlineError('extra_activities_score', errorMessage);
-                    } else if (errorMessage.includes('Projects')) {
-                        showInlineError('project_count', errorMessage);
-                    } else if (errorMessage.includes('Backlogs')) {
-                        showInlineError('backlogs', errorMessage);
-                    }
-                });
+            if (err.fieldErrors) {
+                clearInlineErrors();
+                showFormErrors(this, err.fieldErrors);
             } else {
                 alert('Error adding student: ' + err.message);
             }
@@ -231,7 +236,9 @@ document.addEventListener('DOMContentLoaded', function() {
         .then(res => {
             if (!res.ok) {
                 return res.json().then(errData => {
-                    throw new Error(errData.errors ? errData.errors.join(', ') : 'Unknown error');
+                    const error = new Error(errData.errors ? Object.values(errData.errors).join(', ') : 'Unknown error');
+                    error.fieldErrors = errData.errors;
+                    throw error;
                 });
             }
             return res.json();
@@ -253,20 +260,9 @@ document.addEventListener('DOMContentLoaded', function() {
         })
         .catch(err => {
             // Handle validation errors for update modal
-            if (err.message.includes('value must be less than or equal to')) {
-                // Parse the error message to extract field names and error messages
-                const errorMessages = err.message.split(', ');
-                errorMessages.forEach(errorMessage => {
-                    if (errorMessage.includes('Previous Sem GPA')) {
-                        showInlineError('updatePreviousSemPercent', errorMessage);
-                    } else if (errorMessage.includes('Extra Activities')) {
-                        showInlineError('updateExtraActivitiesScore', errorMessage);
-                    } else if (errorMessage.includes('Projects')) {
-                        showInlineError('updateProjectCount', errorMessage);
-                    } else if (errorMessage.includes('Backlogs')) {
-                        showInlineError('updateBacklogs', errorMessage);
-                    }
-                });
+            if (err.fieldErrors) {
+                clearInlineErrors();
+                showFormErrors(document.getElementById('updateStudentForm'), err.fieldErrors);
             } else {
                 alert('Error updating student: ' + err.message);
             }
@@ -296,7 +292,9 @@ document.addEventListener('DOMContentLoaded', function() {
         .then(res => {
             if (!res.ok) {
                 return res.json().then(errData => {
-                    throw new Error(errData.errors ? errData.errors.join(', ') : 'Unknown error');
+                    const error = new Error(errData.errors ? Object.values(errData.errors).join(', ') : 'Unknown error');
+                    error.fieldErrors = errData.errors;
+                    throw error;
                 });
             }
             return res.json();
@@ -317,20 +315,9 @@ document.addEventListener('DOMContentLoaded', function() {
         })
         .catch(err => {
             // Handle validation errors for custom update modal
-            if (err.message.includes('value must be less than or equal to')) {
-                // Parse the error message to extract field names and error messages
-                const errorMessages = err.message.split(', ');
-                errorMessages.forEach(errorMessage => {
-                    if (errorMessage.includes('Previous Sem GPA')) {
-                        showInlineError('customUpdatePreviousSemPercent', errorMessage);
-                    } else if (errorMessage.includes('Extra Activities')) {
-                        showInlineError('customUpdateExtraActivitiesScore', errorMessage);
-                    } else if (errorMessage.includes('Projects')) {
-                        showInlineError('customUpdateProjectCount', errorMessage);
-                    } else if (errorMessage.includes('Backlogs')) {
-                        showInlineError('customUpdateBacklogs', errorMessage);
-                    }
-                });
+            if (err.fieldErrors) {
+                clearInlineErrors();
+                showFormErrors(document.getElementById('customUpdateStudentForm'), err.fieldErrors);
             } else {
                 alert('Error updating student: ' + err.message);
             }
@@ -423,19 +410,19 @@ function renderTable() {
     filtered.forEach(s => {
         // Create red dot indicators for red zone fields
         const redFields = s.red_zone_fields || [];
-        const weekendExamHtml = redFields.includes('weekend_exam') ? `${s.weekend_exam}<span class="red-dot"></span>` : s.weekend_exam;
-        const midMarksHtml = redFields.includes('mid_marks') ? `${s.mid_marks}<span class="red-dot"></span>` : s.mid_marks;
-        const crtScoreHtml = redFields.includes('crt_score') ? `${s.crt_score}<span class="red-dot"></span>` : s.crt_score;
-        const attendanceHtml = redFields.includes('attendance_percent') ? `${s.attendance_percent}<span class="red-dot"></span>` : s.attendance_percent;
-        const gdAttendanceHtml = redFields.includes('gd_attendance') ? `${s.gd_attendance}<span class="red-dot"></span>` : s.gd_attendance;
-        const prevSemHtml = redFields.includes('previous_sem_percent') ? `${s.previous_sem_percent}<span class="red-dot"></span>` : s.previous_sem_percent;
-        const extraActivitiesHtml = redFields.includes('extra_activities_score') ? `${s.extra_activities_score}<span class="red-dot"></span>` : s.extra_activities_score;
-        const projectCountHtml = redFields.includes('project_count') ? `${s.project_count}<span class="red-dot"></span>` : s.project_count;
-        const backlogsHtml = redFields.includes('backlogs') ? `${s.backlogs}<span class="red-dot"></span>` : s.backlogs;
+        const weekendExamHtml = redFields.includes('weekend_exam') ? `${displayValue(s.weekend_exam)}<span class="red-dot"></span>` : displayValue(s.weekend_exam);
+        const midMarksHtml = redFields.includes('mid_marks') ? `${displayValue(s.mid_marks)}<span class="red-dot"></span>` : displayValue(s.mid_marks);
+        const crtScoreHtml = redFields.includes('crt_score') ? `${displayValue(s.crt_score)}<span class="red-dot"></span>` : displayValue(s.crt_score);
+        const attendanceHtml = redFields.includes('attendance_percent') ? `${displayValue(s.attendance_percent)}<span class="red-dot"></span>` : displayValue(s.attendance_percent);
+        const gdAttendanceHtml = redFields.includes('gd_attendance') ? `${displayValue(s.gd_attendance)}<span class="red-dot"></span>` : displayValue(s.gd_attendance);
+        const prevSemHtml = redFields.includes('previous_sem_percent') ? `${displayValue(s.previous_sem_percent)}<span class="red-dot"></span>` : displayValue(s.previous_sem_percent);
+        const extraActivitiesHtml = redFields.includes('extra_activities_score') ? `${displayValue(s.extra_activities_score)}<span class="red-dot"></span>` : displayValue(s.extra_activities_score);
+        const projectCountHtml = redFields.includes('project_count') ? `${displayValue(s.project_count)}<span class="red-dot"></span>` : displayValue(s.project_count);
+        const backlogsHtml = redFields.includes('backlogs') ? `${displayValue(s.backlogs)}<span class="red-dot"></span>` : displayValue(s.backlogs);
 
         let tr = document.createElement('tr');
         tr.innerHTML = `
-            <td>${s.name}</td>
+            <td>${displayValue(s.name)}</td>
             <td>${weekendExamHtml}</td>
             <td>${midMarksHtml}</td>
             <td>${crtScoreHtml}</td>
@@ -455,11 +442,16 @@ function renderTable() {
     });
 }
 
+function displayValue(value) {
+    // Blank fields are stored as null; show them as empty cells
+    return value ?? '';
+}
+
 function getFilteredStudents() {
     const search = document.getElementById('searchInput').value.toLowerCase();
     const zone = document.getElementById('zoneFilter').value;
     return studentsData.filter(s => {
-        let match = s.name.toLowerCase().includes(search);
+        let match = (s.name || '').toLowerCase().includes(search);
         if (zone && s.zone !== zone) match = false;
         return match;
     });
@@ -509,15 +501,15 @@ window.updateStudent = function(id) {
     // Populate the custom modal with student data
     document.getElementById('customUpdateStudentId').value = id;
     document.getElementById('customUpdateName').value = studentData.name || '';
-    document.getElementById('customUpdateWeekendExam').value = studentData.weekend_exam || '';
-    document.getElementById('customUpdateMidMarks').value = studentData.mid_marks || '';
-    document.getElementById('customUpdateCrtScore').value = studentData.crt_score || '';
-    document.getElementById('customUpdateAttendancePercent').value = studentData.attendance_percent || '';
-    document.getElementById('customUpdateGdAttendance').value = studentData.gd_attendance || '';
-    document.getElementById('customUpdatePreviousSemPercent').value = studentData.previous_sem_percent || '';
-    document.getElementById('customUpdateBacklogs').value = studentData.backlogs || '';
-    document.getElementById('customUpdateExtraActivitiesScore').value = studentData.extra_activities_score || '';
-    document.getElementById('customUpdateProjectCount').value = studentData.project_count || '';
+    document.getElementById('customUpdateWeekendExam').value = studentData.weekend_exam ?? '';
+    document.getElementById('customUpdateMidMarks').value = studentData.mid_marks ?? '';
+    document.getElementById('customUpdateCrtScore').value = studentData.crt_score ?? '';
+    document.getElementById('customUpdateAttendancePercent').value = studentData.attendance_percent ?? '';
+    document.getElementById('customUpdateGdAttendance').value = studentData.gd_attendance ?? '';
+    document.getElementById('customUpdatePreviousSemPercent').value = studentData.previous_sem_percent ?? '';
+    document.getElementById('customUpdateBacklogs').value = studentData.backlogs ?? '';
+    document.getElementById('customUpdateExtraActivitiesScore').value = studentData.extra_activities_score ?? '';
+    document.getElementById('customUpdateProjectCount').value = studentData.project_count ?? '';
     
     console.log('Custom modal populated with student data');
     
@@ -0,0 +1,124 @@
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import UpdateOne
+
+from validation import migrate_student_types, validate_student, validate_students
+
+
+def valid_record(**overrides):
+    record = {
+        'name': 'Asha', 'weekend_exam': '80', 'mid_marks': '75', 'crt_score': '70',
+        'attendance_percent': '90', 'gd_attendance': '85', 'previous_sem_percent': '8.5',
+        'extra_activities_score': '2', 'project_count': '1', 'backlogs': '0',
+    }
+    record.update(overrides)
+    return record
+
+
+def test_coerces_numeric_strings():
+    data, errors = validate_student(valid_record(weekend_exam='85', backlogs='2.0'))
+    assert errors == {}
+    assert data['weekend_exam'] == 85.0 and isinstance(data['weekend_exam'], float)
+    assert data['backlogs'] == 2 and isinstance(data['backlogs'], int)
+    assert data['name'] == 'Asha'
+
+
+def test_rejects_fractional_int_fields():
+    data, errors = validate_student(valid_record(project_count='1.5'))
+    assert errors == {'project_count': 'Projects value must be a whole number'}
+    assert 'project_count' not in data
+
+
+def test_rejects_non_finite_and_bool_values():
+    _, errors = validate_student(valid_record(crt_score='nan', mid_marks='inf', backlogs=True))
+    assert errors == {
+        'crt_score': 'CRT Score value must be a number',
+        'mid_marks': 'Mid Marks value must be a number',
+        'backlogs': 'Backlogs value must be a number',
+    }
+    _, errors = validate_student(valid_record(weekend_exam=math.inf))
+    assert 'weekend_exam' in errors
+
+
+def test_overflowing_int_is_not_reported_as_fractional():
+    _, errors = validate_student(valid_record(project_count=10 ** 400, backlogs='abc'))
+    assert errors == {
+        'project_count': 'Projects value must be a number',
+        'backlogs': 'Backlogs value must be a number',
+    }
+
+
+def test_enforces_bounds():
+    _, errors = validate_student(valid_record(weekend_exam='-5', previous_sem_percent='11'))
+    assert errors == {
+        'weekend_exam': 'Weekend Exam value must be greater than or equal to 0',
+        'previous_sem_percent': 'Previous Sem GPA value must be less than or equal to 10',
+    }
+
+
+def test_blank_values():
+    data, errors = validate_student(valid_record(mid_marks='', gd_attendance='  ', backlogs=None))
+    assert errors == {}
+    assert data['mid_marks'] is None
+    assert data['gd_attendance'] is None
+    assert data['backlogs'] is None
+
+    _, errors = validate_student(valid_record(name='  '))
+    assert errors == {'name': 'Name is required'}
+
+
+def test_batch_reports_errors_by_index():
+    records = [valid_record(), valid_record(backlogs='99'), valid_record(name='Ravi')]
+    valid, errors = validate_students(records)
+    assert [d['name'] for d in valid] == ['Asha', 'Ravi']
+    assert errors == {1: {'backlogs': 'Backlogs value must be less than or equal to 15'}}
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.writes = []
+
+    def find(self, query, projection):
+        return iter(self.docs)
+
+    def bulk_write(self, requests, ordered=True):
+        self.writes.append(list(requests))
+
+
+def test_migration_sets_only_string_fields():
+    collection = FakeCollection([
+        {'_id': 1, 'weekend_exam': '80', 'mid_marks': 70.0, 'backlogs': '1'},
+        {'_id': 2, 'crt_score': 'abc', 'project_count': 99},
+        {'_id': 3, 'crt_score': 'abc', 'attendance_percent': ''},
+    ])
+    updated, skipped = migrate_student_types(collection)
+    assert updated == 2
+    assert skipped == 2
+    assert collection.writes == [[
+        UpdateOne({'_id': 1}, {'$set': {'weekend_exam': 80.0, 'backlogs': 1}}),
+        UpdateOne({'_id': 3}, {'$set': {'attendance_percent': None}}),
+    ]]
+
+
+def test_migration_converts_out_of_range_strings():
+    collection = FakeCollection([
+        {'_id': 1, 'backlogs': '20', 'weekend_exam': '-3', 'extra_activities_score': '7.5'},
+    ])
+    assert migrate_student_types(collection) == (1, 0)
+    assert collection.writes == [[
+        UpdateOne({'_id': 1}, {'$set': {
+            'weekend_exam': -3.0, 'extra_activities_score': 7.5, 'backlogs': 20,
+        }}),
+    ]]
+
+
+def test_migration_flushes_in_batches():
+    collection = FakeCollection([{'_id': i, 'backlogs': '0'} for i in range(5)])
+    updated, skipped = migrate_student_types(collection, batch_size=2)
+    assert (updated, skipped) == (5, 0)
+    assert [len(batch) for batch in collection.writes] == [2, 2, 1]
@@ -0,0 +1,157 @@
+"""Student field schema, validation/coercion and the type migration."""
+import math
+
+from pymongo import UpdateOne
+
+STUDENT_FIELDS = [
+    'name', 'weekend_exam', 'mid_marks', 'crt_score', 'attendance_percent', 'gd_attendance',
+    'previous_sem_percent', 'extra_activities_score', 'project_count',
+    'backlogs'
+]
+
+# Field schema: type to store the value as, optional bounds (matching the
+# min/max set on the form inputs) and the label used in validation messages.
+# Blank values of required fields are rejected, other blank values are stored
+# as None.
+STUDENT_SCHEMA = {
+    'name': {'type': str, 'required': True, 'label': 'Name'},
+    'weekend_exam': {'type': float, 'min': 0, 'max': 100, 'label': 'Weekend Exam'},
+    'mid_marks': {'type': float, 'min': 0, 'max': 100, 'label': 'Mid Marks'},
+    'crt_score': {'type': float, 'min': 0, 'max': 100, 'label': 'CRT Score'},
+    'attendance_percent': {'type': float, 'min': 0, 'max': 100, 'label': 'Attendance'},
+    'gd_attendance': {'type': float, 'min': 0, 'max': 100, 'label': 'GD Attendance'},
+    'previous_sem_percent': {'type': float, 'min': 0, 'max': 10, 'label': 'Previous Sem GPA'},
+    'extra_activities_score': {'type': int, 'min': 0, 'max': 10, 'label': 'Extra Activities'},
+    'project_count': {'type': int, 'min': 0, 'max': 10, 'label': 'Projects'},
+    'backlogs': {'type': int, 'min': 0, 'max': 15, 'label': 'Backlogs'},
+}
+
+NUMERIC_FIELDS = [f for f in STUDENT_FIELDS if STUDENT_SCHEMA[f]['type'] in (int, float)]
+
+class NotWholeNumberError(ValueError):
+    # Raised by coerce_number when an int field is given a fractional value
+    pass
+
+def coerce_number(value, kind):
+    # Raises ValueError if the value cannot be stored as the given type
+    # (NotWholeNumberError if only the fractional part is the problem)
+    if isinstance(value, bool):
+        raise ValueError
+    if isinstance(value, (int, float)):
+        number = value
+    else:
+        number = float(value)
+    if not math.isfinite(number):
+        raise ValueError
+    if kind is int:
+        if float(number) != int(number):
+            raise NotWholeNumberError
+        return int(number)
+    return float(number)
+
+def compile_student_validator(schema=STUDENT_SCHEMA, fields=STUDENT_FIELDS):
+    # Resolve the schema once into a flat list of checks so each record is
+    # validated and coerced in a single pass over its fields
+    checks = []
+    for field in fields:
+        spec = schema[field]
+        checks.append((field, spec['type'], spec.get('required', False),
+                       spec.get('min'), spec.get('max'), spec.get('label', field)))
+
+    def validate(record):
+        data = {}
+        errors = {}
+        for field, kind, required, minimum, maximum, label in checks:
+            value = record.get(field)
+            if isinstance(value, str):
+                value = value.strip()
+            if value is None or value == '':
+                if required:
+                    errors[field] = f"{label} is required"
+                else:
+                    data[field] = None
+                continue
+            if kind is str:
+                data[field] = str(value)
+                continue
+            try:
+                number = coerce_number(value, kind)
+            except NotWholeNumberError:
+                errors[field] = f"{label} value must be a whole number"
+                continue
+            except (TypeError, ValueError, OverflowError):
+                errors[field] = f"{label} value must be a number"
+                continue
+            if minimum is not None and number < minimum:
+                errors[field] = f"{label} value must be greater than or equal to {minimum}"
+                continue
+            if maximum is not None and number > maximum:
+                errors[field] = f"{label} value must be less than or equal to {maximum}"
+                continue
+            data[field] = number
+        return data, errors
+
+    return validate
+
+validate_student = compile_student_validator()
+
+def validate_students(records):
+    # Batch variant for the bulk/CSV imports. Those routes (upload, csv_upload)
+    # are still placeholders, so nothing calls this yet. Returns the coerced
+    # documents that passed and a mapping of record index -> errors for the
+    # ones that did not.
+    valid = []
+    errors = {}
+    for index, record in enumerate(records):
+        data, record_errors = validate_student(record)
+        if record_errors:
+            errors[index] = record_errors
+        else:
+            valid.append(data)
+    return valid, errors
+
+MIGRATION_BATCH_SIZE = 1000
+
+def _convert_legacy_value(value, kind):
+    # Type conversion only: the schema bounds are not applied, so values the
+    # old code accepted are kept. Fractional values of int fields stay floats.
+    # Raises ValueError/OverflowError if the string is not a number at all.
+    value = value.strip()
+    if value == '':
+        return None
+    try:
+        return coerce_number(value, kind)
+    except NotWholeNumberError:
+        return float(value)
+
+def migrate_student_types(collection, batch_size=MIGRATION_BATCH_SIZE):
+    # Convert string-typed numeric fields left by older versions into numbers,
+    # writing the updates in fixed-size batches. Returns the number of updated
+    # documents and of documents with a string that is not a number.
+    updated = 0
+    unconvertible = 0
+    updates = []
+    query = {'$or': [{field: {'$type': 'string'}} for field in NUMERIC_FIELDS]}
+    for doc in collection.find(query, {field: 1 for field in NUMERIC_FIELDS}):
+        changes = {}
+        failed = False
+        for field in NUMERIC_FIELDS:
+            value = doc.get(field)
+            if not isinstance(value, str):
+                continue
+            try:
+                changes[field] = _convert_legacy_value(value, STUDENT_SCHEMA[field]['type'])
+            except (ValueError, OverflowError):
+                failed = True
+        if failed:
+            unconvertible += 1
+        if changes:
+            updates.append(UpdateOne({'_id': doc['_id']}, {'$set': changes}))
+        if len(updates) >= batch_size:
+            collection.bulk_write(updates, ordered=False)
+            updated += len(updates)
+            updates = []
+    if updates:
+        collection.bulk_write(updates, ordered=False)
+        updated += len(updates)
+    return updated, unconvertible